@@ -2,30 +2,177 @@
 
 # pylint: disable=R0901
 # pylint: disable=R0903
-# pylint: disable=W0102
-from typing import List, Union
-from .typedefs import Mapping, Properties
+import functools
+import sys
+from typing import TYPE_CHECKING, List, Union
+from .typedefs import Mapping, format_properties, format_properties_inline, format_value
+
+_CALL = sys.intern(' CALL')
+_CREATE = sys.intern(' CREATE')
+_MATCH = sys.intern(' MATCH')
+_MERGE = sys.intern(' MERGE')
+_ON_CREATE = sys.intern(' ON CREATE')
+_ON_MATCH = sys.intern(' ON MATCH')
+_MATCH_OPT = sys.intern(' OPTIONAL MATCH')
+_OP_END = sys.intern(' )')
+_WHERE = sys.intern(' WHERE ')
+_YIELD = sys.intern(' YIELD ')
+_AS = sys.intern(' as ')
+
+_NODE_NO_SPACE_SUFFIXES = frozenset(('-', '>', '<'))
+
+
+def _yield_one(mapping) -> str:
+    """Format a YIELD clause for a single (name, alias) mapping."""
+    name, alias = mapping
+    return f'{_YIELD}{name}{_AS}{alias if alias else name.replace(".", "_")}'
+
+
+def _with_subclasses(*classes: type) -> frozenset:
+    """Get a set of the given classes, along with all of their (transitive) subclasses defined so far."""
+    result = set()
+    pending = list(classes)
+    while pending:
+        cls = pending.pop()
+        if cls not in result:
+            result.add(cls)
+            pending.extend(cls.__subclasses__())
+
+    return frozenset(result)
+
+
+def _merged_namespace(*classes: type, **namespace) -> dict:
+    """Merge the public attributes of the given classes into a single class namespace (earlier classes win)."""
+    merged = {}
+    for cls in classes:
+        for name, attr in vars(cls).items():
+            if not name.startswith('_'):
+                merged.setdefault(name, attr)
+
+    merged.update(namespace, __slots__=())
+    return merged
+
+
+def _flatten_methods(classes) -> None:
+    """Copy the public attributes each class inherits onto the class itself, so lookups do not walk its MRO."""
+    for cls in classes:
+        inherited = {}
+        for base in reversed(cls.__mro__[1:]):
+            inherited.update((name, attr) for name, attr in vars(base).items() if not name.startswith('_'))
+
+        for name, attr in inherited.items():
+            if name not in vars(cls):
+                setattr(cls, name, attr)
+
+
+def _warm_attribute_cache(classes) -> None:
+    """Look up every public attribute of the given classes once, filling the interpreter's type attribute cache."""
+    for cls in classes:
+        for name in dir(cls):
+            if not name.startswith('_'):
+                getattr(cls, name, None)
+
+
+def _format_node(labels=None, ref_name: str = None, properties: dict = None) -> str:
+    """Format a graph node pattern, e.g. (n: Person {name : "Bob"})."""
+    if not labels:
+        labels_string = ''
+    elif isinstance(labels, str):
+        labels_string = f': {labels}'
+    else:
+        labels_string = f': {": ".join(labels).strip()}'
+
+    if not properties:
+        property_string = ''
+    else:
+        property_string = ' ' + format_properties_inline(properties)
+
+    if type(ref_name) is str and len(ref_name) < 64 and ref_name.isidentifier():
+        ref_name = sys.intern(ref_name)
+    elif not ref_name:
+        ref_name = ''
+
+    return f'({ref_name}{labels_string}{property_string})'
+
+
+def _build_relation_body(label: str, ref_name: str, relation_properties: str) -> str:
+    """Format the bracketed part of a relationship pattern, given its already formatted properties string."""
+    relation_type = '' if label is None else f': {label}'
+    relation_ref_name = '' if ref_name is None else f'{ref_name}'
+
+    if relation_ref_name or relation_type:
+        return f'[{relation_ref_name}{relation_type}{relation_properties}]'
+
+    return ''
+
+
+def _format_relation_body(label: str = None, ref_name: str = None, properties: dict = None) -> str:
+    """Format the bracketed part of a relationship pattern, e.g. [r: KNOWS], to be wrapped with its direction."""
+    relation_properties = ' ' + format_properties_inline(properties) if properties else ''
+    return _build_relation_body(label, ref_name, relation_properties)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _format_variable_length_relation(min_hops: int = -1, max_hops: int = -1) -> str:
+    """Format an undirectional variable length relationship pattern, e.g. -[*1..3]- (-1 leaves a boundary open)."""
+    if min_hops == -1:
+        return '-[*]-' if max_hops == -1 else f'-[*..{max_hops}]-'
+    if max_hops == -1:
+        return f'-[*{min_hops}..]-'
+    if min_hops == max_hops:
+        return f'-[*{min_hops}]-'
+
+    return f'-[*{min_hops}..{max_hops}]-'
 
 
 class Query():
     """A general query-descripting class ."""
 
-    def __init__(self, query):
-        """Initialize the query object."""
-        self.query = query
+    __slots__ = ('_parent', '_fragment', '_text')
+
+    def __init__(self, parent, fragment: str = ''):
+        """Initialize the query object, as the given fragment appended to a parent query (None for a new query)."""
+        self._parent = parent
+        self._fragment = fragment
+        self._text = None
+
+    @property
+    def query(self) -> str:
+        """Get the query string built so far (not stripped)."""
+        return self._join()
+
+    def _join(self) -> str:
+        """Join the fragments of this query and all of its parents into a single string (memoized per query)."""
+        text = self._text
+        if text is None:
+            parts = []
+            node = self
+            while node is not None:
+                if node._text is not None:
+                    parts.append(node._text)
+                    break
+
+                parts.append(node._fragment)
+                node = node._parent
+
+            parts.reverse()
+            text = self._text = ''.join(parts)
+
+        return text
 
     def __str__(self) -> str:
         """Implement the str() operator for the query builder."""
-        return self.query.strip()
+        return self._join().strip()
 
     def __add__(self, other):
         """Implement the + operator for the query builder."""
-        return Query(self.query.strip() + ' ' + other.query.strip())
+        return Query(self, other._join())
 
     def __iadd__(self, other):
-        """Implement the += operator for the query builder."""
-        self.query = self.query.strip() + ' ' + other.query.strip()
-        return self
+        """Implement the += operator for the query builder, keeping the type of the current query."""
+        result = type(self).__new__(type(self))
+        Query.__init__(result, self, other._join())
+        return result
 
     def get(self):
         """Get the final query string ."""
@@ -33,28 +180,34 @@ class Query():
 
     def cypher(self, cypher_query_str):
         """Concatenate a cypher query string"""
-        return AnyAvailable(self.query.strip() + ' ' + cypher_query_str.strip())
+        return AnyAvailable(self, ' ' + cypher_query_str.strip())
 
 
 class QueryStart(Query):
     """A class for representing a "QUERY START" clause."""
 
+    __slots__ = ()
+
 
 class Call(Query):
     """A class for representing a "CALL" clause."""
 
+    __slots__ = ()
+
     def call(self):
         """Concatenate the "CALL" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: CallAvailable
         """
-        return CallAvailable(self.query + ' CALL')
+        return CallAvailable(self, _CALL)
 
 
 class CaseWhen(Query):
     """A class for representing a "CASE WHEN" clause."""
 
+    __slots__ = ()
+
     def case_when(self, filters: dict, on_true: str, on_false: str, ref_name: str, comparison_operator: str = "=", boolean_operator: str = "AND"):
         """Concatenate a CASE WHEN clause to the query, created from a list of given property filters.
 
@@ -75,26 +228,30 @@ class CaseWhen(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: CaseWhenAvailable
         """
-        filt = ' CASE WHEN ' + Properties(filters).to_str(comparison_operator, boolean_operator)
-        filt += f' THEN {on_true} ELSE {on_false} END as {ref_name}'
-        return CaseWhenAvailable(self.query + filt)
+        predicates = format_properties(filters, comparison_operator, boolean_operator) if filters else ''
+        filt = f' CASE WHEN {predicates} THEN {on_true} ELSE {on_false} END as {ref_name}'
+        return CaseWhenAvailable(self, filt)
 
 
 class Create(Query):
     """A class for representing a "CREATE" clause."""
 
+    __slots__ = ()
+
     def create(self):
         """Concatenate the "CREATE" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: CreateAvailable
         """
-        return CreateAvailable(self.query + ' CREATE')
+        return CreateAvailable(self, _CREATE)
 
 
 class Delete(Query):
     """A class for representing a "DELETE" clause."""
 
+    __slots__ = ()
+
     def delete(self, ref_name: str):
         """Concatenate a DELETE clause for a referenced instance from the DB.
 
@@ -104,8 +261,8 @@ class Delete(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: DeleteAvailable
         """
-        ret = f' DELETE {ref_name}'
-        return DeleteAvailable(self.query + ret)
+        ret = ' DELETE ' + ref_name
+        return DeleteAvailable(self, ret)
 
     def detach_delete(self, ref_name: str):
         """Concatenate a DETACH DELETE clause for a referenced instance from the DB.
@@ -116,13 +273,15 @@ class Delete(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: DeleteAvailable
         """
-        ret = f' DETACH DELETE {ref_name}'
-        return DeleteAvailable(self.query + ret)
+        ret = ' DETACH DELETE ' + ref_name
+        return DeleteAvailable(self, ret)
 
 
 class Limit(Query):
     """A class for representing a "LIMIT" clause."""
 
+    __slots__ = ()
+
     def limit(self, limitation: Union[int, str]):
         """Concatenate a limit statement.
 
@@ -133,20 +292,22 @@ class Limit(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: LimitAvailable
         """
-        ret = f" LIMIT {limitation}"
-        return LimitAvailable(self.query + ret)
+        ret = ' LIMIT ' + str(limitation)
+        return LimitAvailable(self, ret)
 
 
 class Match(Query):
     """A class for representing a "MATCH" clause."""
 
+    __slots__ = ()
+
     def match(self):
         """Concatenate the "MATCH" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: MatchAvailable
         """
-        return MatchAvailable(self.query + ' MATCH')
+        return MatchAvailable(self, _MATCH)
 
     def match_optional(self):
         """Concatenate the "MATCH" clause.
@@ -154,24 +315,28 @@ class Match(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: MatchAvailable
         """
-        return MatchAvailable(self.query + ' OPTIONAL MATCH ')
+        return MatchAvailable(self, _MATCH_OPT)
 
 
 class Merge(Query):
     """A class for representing a "MERGE" clause."""
 
+    __slots__ = ()
+
     def merge(self):
         """Concatenate the "MERGE" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: MergeAvailable
         """
-        return MergeAvailable(self.query + ' MERGE')
+        return MergeAvailable(self, _MERGE)
 
 
 class Node(Query):
     """A class for representing a "NODE" clause."""
 
+    __slots__ = ()
+
     def node(self, labels: List[str] = None, ref_name: str = None, properties: dict = None):
         """Concatenate a graph Node, which may be filtered using any label/s and/or property/properties.
 
@@ -185,35 +350,22 @@ class Node(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: NodeAvailable
         """
-        if not labels:
-            labels_string = ''
-        elif isinstance(labels, str):
-            labels_string = f': {labels}'
-        else:
-            labels_string = f': {": ".join(labels).strip()}'
-
-        if not properties:
-            property_string = ''
-        else:
-            property_string = f' {{{str(Properties(properties))}}}'
-
-        ref_name = ref_name or ''
-
-        query = self.query
-        if not (query.endswith('-') or query.endswith('>') or query.endswith('<')):
-            query += ' '
+        node_string = _format_node(labels, ref_name, properties)
 
-        query += f'({ref_name}{labels_string}{property_string})'
+        if self._fragment[-1:] not in _NODE_NO_SPACE_SUFFIXES:
+            node_string = ' ' + node_string
 
         if isinstance(self, MergeAvailable):
-            return NodeAfterMergeAvailable(query)
+            return NodeAfterMergeAvailable(self, node_string)
 
-        return NodeAvailable(query)
+        return NodeAvailable(self, node_string)
 
 
 class NodeAfterMerge(Query):
     """A class for representing a "NODE AFTER MERGE" clause."""
 
+    __slots__ = ()
+
     def node(self, labels: List[str] = None, ref_name: str = None, properties: dict = None):
         """Concatenate a graph Node, which may be filtered using any label/s and/or property/properties.
 
@@ -227,71 +379,64 @@ class NodeAfterMerge(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: NodeAfterMergeAvailable
         """
-        if not labels:
-            labels_string = ''
-        elif isinstance(labels, str):
-            labels_string = f': {labels}'
-        else:
-            labels_string = f': {": ".join(labels).strip()}'
-
-        if not properties:
-            property_string = ''
-        else:
-            property_string = f' {{{str(Properties(properties))}}}'
-
-        ref_name = ref_name or ''
+        node_string = _format_node(labels, ref_name, properties)
 
-        query = self.query
-        if not (query.endswith('-') or query.endswith('>') or query.endswith('<')):
-            query += ' '
-
-        query += f'({ref_name}{labels_string}{property_string})'
+        if self._fragment[-1:] not in _NODE_NO_SPACE_SUFFIXES:
+            node_string = ' ' + node_string
 
         if isinstance(self, MergeAvailable):
-            return NodeAfterMergeAvailable(query)
+            return NodeAfterMergeAvailable(self, node_string)
 
-        return NodeAvailable(query)
+        return NodeAvailable(self, node_string)
 
 
 class OnCreate(Query):
     """A class for representing a "ON CREATE" clause."""
 
+    __slots__ = ()
+
     def on_create(self):
         """Concatenate the "ON CREATE" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: OnCreateAvailable
         """
-        return OnCreateAvailable(self.query + ' ON CREATE')
+        return OnCreateAvailable(self, _ON_CREATE)
 
 
 class OnMatch(Query):
     """A class for representing a "ON MATCH" clause."""
 
+    __slots__ = ()
+
     def on_match(self):
         """Concatenate the "ON MATCH" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: OnMatchAvailable
         """
-        return OnMatchAvailable(self.query + ' ON MATCH')
+        return OnMatchAvailable(self, _ON_MATCH)
 
 
 class OperatorEnd(Query):
     """A class for representing a "OPERATOR END" clause."""
 
+    __slots__ = ()
+
     def operator_end(self):
         """Concatenate the "OPERATOR END" clause.
 
         :return: A Query object with a query that contains the new clause.
         :rtype: OperatorEndAvailable
         """
-        return OperatorEndAvailable(self.query + ' )')
+        return OperatorEndAvailable(self, _OP_END)
 
 
 class OperatorStart(Query):
     """A class for representing a "OPERATOR START" clause."""
 
+    __slots__ = ()
+
     def operator_start(self, operator: str, ref_name: str = None, args: dict = None):
         """Concatenate an operator (e.g. ShortestPath), where its result may be given a name for future reference.
 
@@ -308,12 +453,14 @@ class OperatorStart(Query):
         result_name = '' if ref_name is None else f'{ref_name} = '
         arguments = '' if args is None else f' {args}'
 
-        return OperatorStartAvailable(self.query + f' {result_name}{operator}({arguments}')
+        return OperatorStartAvailable(self, f' {result_name}{operator}({arguments}')
 
 
 class OrderBy(Query):
     """A class for representing a "ORDER BY" clause."""
 
+    __slots__ = ()
+
     def order_by(self, sorting_properties: Union[str, List[str]], ascending: bool = True):
         """Concatenate an order by statement.
 
@@ -325,17 +472,18 @@ class OrderBy(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: OrderByAvailable
         """
-        if type(sorting_properties) != list:
-            sorting_properties = [sorting_properties]
+        if isinstance(sorting_properties, list):
+            sorting_properties = ', '.join(sorting_properties)
 
-        ret = f" ORDER BY {', '.join(sorting_properties)}"
-        ret += " ASC" if ascending else " DESC"
-        return OrderByAvailable(self.query + ret)
+        ret = ' ORDER BY ' + sorting_properties + (' ASC' if ascending else ' DESC')
+        return OrderByAvailable(self, ret)
 
 
 class Relation(Query):
     """A class for representing a "RELATION" clause."""
 
+    __slots__ = ()
+
     def related(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate an undirectional (i.e. --) graph Relationship, which may be filtered.
 
@@ -350,9 +498,9 @@ class Relation(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('none', label, ref_name, properties))
+        return RelationAvailable(self, '-' + _format_relation_body(label, ref_name, properties) + '-')
 
-    def related_to(self, label: str = None, ref_name: str = None, properties: dict = {}):
+    def related_to(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate a forward (i.e. -->) graph Relationship, which may be filtered.
 
         :param label: The relationship label (type) in the DB, defaults to None
@@ -360,15 +508,15 @@ class Relation(Query):
         :param ref_name: A reference name to be used later in the rest of the query, defaults to None
         :type ref_name: str
         :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
+            None
         :type properties: dict
 
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('forward', label, ref_name, properties))
+        return RelationAvailable(self, '-' + _format_relation_body(label, ref_name, properties) + '->')
 
-    def related_from(self, label: str = None, ref_name: str = None, properties: dict = {}):
+    def related_from(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate a backward (i.e. <--) graph Relationship, which may be filtered.
 
         :param label: The relationship label (type) in the DB, defaults to None
@@ -376,13 +524,13 @@ class Relation(Query):
         :param ref_name: A reference name to be used later in the rest of the query, defaults to None
         :type ref_name: str
         :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
+            None
         :type properties: dict
 
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('backward', label, ref_name, properties))
+        return RelationAvailable(self, '<-' + _format_relation_body(label, ref_name, properties) + '-')
 
     def related_variable_len(self, min_hops: int = -1, max_hops: int = -1):
         """Concatenate a uni-directional graph Relationship, with a variable path length.
@@ -395,55 +543,14 @@ class Relation(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAvailable
         """
-        min_hops_str = '' if min_hops == -1 else str(min_hops)
-        max_hops_str = '' if max_hops == -1 else str(max_hops)
-
-        relation_length = '*' if min_hops == -1 and max_hops == - \
-            1 else (f'*{min_hops_str}'if min_hops == max_hops else f'*{min_hops_str}..{max_hops_str}')
-
-        if relation_length:
-            realtion_str = f'[{relation_length}]'
-        else:
-            realtion_str = ''
-
-        return RelationAvailable(self.query + f'-{realtion_str}-')
-
-    def _directed_relation(self, direction: str, label: str, ref_name: str = None, properties: dict = {}):
-        """Concatenate a graph Relationship (private method).
-
-        :param direction: The relationship direction, can one of 'forward', 'backward' - otherwise unidirectional
-        :type direction: str
-        :param label: The relationship label (type) in the DB
-        :type label: str
-        :param ref_name: A reference name to be used later in the rest of the query, defaults to None
-        :type ref_name: str
-        :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
-        :type properties: dict
-
-        :return: A Query object with a query that contains the new clause.
-        :rtype: RelationAvailable
-        """
-        relation_type = '' if label is None else f': {label}'
-        relation_ref_name = '' if ref_name is None else f'{ref_name}'
-        relation_properties = f' {{{str(Properties(properties))}}}' if properties else ''
-
-        if relation_ref_name or relation_type:
-            realtion_str = f'[{relation_ref_name}{relation_type}{relation_properties}]'
-        else:
-            realtion_str = ''
-
-        if direction == 'forward':
-            return f'-{realtion_str}->'
-        if direction == 'backward':
-            return f'<-{realtion_str}-'
-
-        return f'-{realtion_str}-'
+        return RelationAvailable(self, _format_variable_length_relation(min_hops, max_hops))
 
 
 class RelationAfterMerge(Query):
     """A class for representing a "RELATION AFTER MERGE" clause."""
 
+    __slots__ = ()
+
     def related(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate an undirectional (i.e. --) graph Relationship, which may be filtered.
 
@@ -458,9 +565,9 @@ class RelationAfterMerge(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAfterMergeAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('none', label, ref_name, properties))
+        return RelationAvailable(self, '-' + _format_relation_body(label, ref_name, properties) + '-')
 
-    def related_to(self, label: str = None, ref_name: str = None, properties: dict = {}):
+    def related_to(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate a forward (i.e. -->) graph Relationship, which may be filtered.
 
         :param label: The relationship label (type) in the DB, defaults to None
@@ -468,15 +575,15 @@ class RelationAfterMerge(Query):
         :param ref_name: A reference name to be used later in the rest of the query, defaults to None
         :type ref_name: str
         :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
+            None
         :type properties: dict
 
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAfterMergeAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('forward', label, ref_name, properties))
+        return RelationAvailable(self, '-' + _format_relation_body(label, ref_name, properties) + '->')
 
-    def related_from(self, label: str = None, ref_name: str = None, properties: dict = {}):
+    def related_from(self, label: str = None, ref_name: str = None, properties: dict = None):
         """Concatenate a backward (i.e. <--) graph Relationship, which may be filtered.
 
         :param label: The relationship label (type) in the DB, defaults to None
@@ -484,13 +591,13 @@ class RelationAfterMerge(Query):
         :param ref_name: A reference name to be used later in the rest of the query, defaults to None
         :type ref_name: str
         :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
+            None
         :type properties: dict
 
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAfterMergeAvailable
         """
-        return RelationAvailable(self.query + self._directed_relation('backward', label, ref_name, properties))
+        return RelationAvailable(self, '<-' + _format_relation_body(label, ref_name, properties) + '-')
 
     def related_variable_len(self, min_hops: int = -1, max_hops: int = -1):
         """Concatenate a uni-directional graph Relationship, with a variable path length.
@@ -503,55 +610,14 @@ class RelationAfterMerge(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: RelationAfterMergeAvailable
         """
-        min_hops_str = '' if min_hops == -1 else str(min_hops)
-        max_hops_str = '' if max_hops == -1 else str(max_hops)
-
-        relation_length = '*' if min_hops == -1 and max_hops == - \
-            1 else (f'*{min_hops_str}'if min_hops == max_hops else f'*{min_hops_str}..{max_hops_str}')
-
-        if relation_length:
-            realtion_str = f'[{relation_length}]'
-        else:
-            realtion_str = ''
-
-        return RelationAvailable(self.query + f'-{realtion_str}-')
-
-    def _directed_relation(self, direction: str, label: str, ref_name: str = None, properties: dict = {}):
-        """Concatenate a graph Relationship (private method).
-
-        :param direction: The relationship direction, can one of 'forward', 'backward' - otherwise unidirectional
-        :type direction: str
-        :param label: The relationship label (type) in the DB
-        :type label: str
-        :param ref_name: A reference name to be used later in the rest of the query, defaults to None
-        :type ref_name: str
-        :param properties: A dict representing the set of properties by which the relationship is filtered, defaults to
-            {}
-        :type properties: dict
-
-        :return: A Query object with a query that contains the new clause.
-        :rtype: RelationAfterMergeAvailable
-        """
-        relation_type = '' if label is None else f': {label}'
-        relation_ref_name = '' if ref_name is None else f'{ref_name}'
-        relation_properties = f' {{{str(Properties(properties))}}}' if properties else ''
-
-        if relation_ref_name or relation_type:
-            realtion_str = f'[{relation_ref_name}{relation_type}{relation_properties}]'
-        else:
-            realtion_str = ''
-
-        if direction == 'forward':
-            return f'-{realtion_str}->'
-        if direction == 'backward':
-            return f'<-{realtion_str}-'
-
-        return f'-{realtion_str}-'
+        return RelationAvailable(self, _format_variable_length_relation(min_hops, max_hops))
 
 
 class Remove(Query):
     """A class for representing a "REMOVE" clause."""
 
+    __slots__ = ()
+
     def remove(self, properties: Union[str, List[str]]):
         """Concatenate a remove by statement.
 
@@ -561,15 +627,17 @@ class Remove(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: RemoveAvailable
         """
-        if type(properties) != list:
-            properties = [properties]
-        ret = f" REMOVE {', '.join(properties)}"
-        return RemoveAvailable(self.query + ret)
+        if isinstance(properties, list):
+            properties = ', '.join(properties)
+        ret = f" REMOVE {properties}"
+        return RemoveAvailable(self, ret)
 
 
 class Return(Query):
     """A class for representing a "RETURN" clause."""
 
+    __slots__ = ()
+
     def return_literal(self, literal: str):
         """Concatenate a literal RETURN statement.
 
@@ -580,9 +648,9 @@ class Return(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: ReturnAvailable
         """
-        ret = f' RETURN {literal}'
+        ret = ' RETURN ' + literal
 
-        return ReturnAvailable(self.query + ret)
+        return ReturnAvailable(self, ret)
 
     def return_mapping(self, mappings: List[Mapping]):
         """Concatenate a RETURN statement for mutiple objects.
@@ -597,20 +665,23 @@ class Return(Query):
             mappings = [mappings]
 
         ret = ' RETURN ' + \
-            ', '.join(
+            ', '.join([
                 f'{mapping[0]} as {mapping[1]}' if mapping[1] else mapping[0].replace(".", "_")
-                for mapping in mappings)
+                for mapping in mappings])
 
-        return ReturnAvailable(self.query + ret)
+        return ReturnAvailable(self, ret)
 
 
 class Set(Query):
     """A class for representing a "SET" clause."""
 
+    __slots__ = ()
+
     def set(self, properties: dict, escape_values: bool = True):
         """Concatenate a SET clause, using the given properties map.
 
-        :param properties: A dict to be used to set the variables with their corresponding values
+        :param properties: A dict to be used to set the variables with their corresponding values (an empty dict adds
+            no SET clause)
         :type properties: dict
         :param escape_values: Determines whether the properties values should be escaped or not, defaults to True
         :type escape_values: bool
@@ -618,21 +689,24 @@ class Set(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: SetAvailable
         """
-        query = self.query + ' SET ' + Properties(properties).to_str("=", ", ", escape_values)
+        ret = ' SET ' + format_properties(properties, "=", ", ", escape_values) if properties else ''
 
-        if isinstance(self, NodeAfterMergeAvailable) or isinstance(self, OnCreateAvailable) or isinstance(self, OnMatchAvailable) or isinstance(self, SetAfterMergeAvailable):
-            return SetAfterMergeAvailable(query)
+        if type(self) in _SET_AFTER_MERGE_TYPES:
+            return SetAfterMergeAvailable(self, ret)
 
-        return SetAvailable(query)
+        return SetAvailable(self, ret)
 
 
 class SetAfterMerge(Query):
     """A class for representing a "SET AFTER MERGE" clause."""
 
+    __slots__ = ()
+
     def set(self, properties: dict, escape_values: bool = True):
         """Concatenate a SET clause, using the given properties map.
 
-        :param properties: A dict to be used to set the variables with their corresponding values
+        :param properties: A dict to be used to set the variables with their corresponding values (an empty dict adds
+            no SET clause)
         :type properties: dict
         :param escape_values: Determines whether the properties values should be escaped or not, defaults to True
         :type escape_values: bool
@@ -640,17 +714,19 @@ class SetAfterMerge(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: SetAfterMergeAvailable
         """
-        query = self.query + ' SET ' + Properties(properties).to_str("=", ", ", escape_values)
+        ret = ' SET ' + format_properties(properties, "=", ", ", escape_values) if properties else ''
 
-        if isinstance(self, NodeAfterMergeAvailable) or isinstance(self, OnCreateAvailable) or isinstance(self, OnMatchAvailable) or isinstance(self, SetAfterMergeAvailable):
-            return SetAfterMergeAvailable(query)
+        if type(self) in _SET_AFTER_MERGE_TYPES:
+            return SetAfterMergeAvailable(self, ret)
 
-        return SetAvailable(query)
+        return SetAvailable(self, ret)
 
 
 class Skip(Query):
     """A class for representing a "SKIP" clause."""
 
+    __slots__ = ()
+
     def skip(self, skip_count: Union[int, str]):
         """Concatenate a skip statement.
 
@@ -661,13 +737,15 @@ class Skip(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: SkipAvailable
         """
-        ret = f" SKIP {skip_count}"
-        return SkipAvailable(self.query + ret)
+        ret = ' SKIP ' + str(skip_count)
+        return SkipAvailable(self, ret)
 
 
 class Unwind(Query):
     """A class for representing a "UNWIND" clause."""
 
+    __slots__ = ()
+
     def unwind(self, variables: str):
         """Concatenate an UNWIND clause, keeping one or more variables given in 'variables' arg.
 
@@ -677,12 +755,14 @@ class Unwind(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: UnwindAvailable
         """
-        return UnwindAvailable(self.query + f' UNWIND {variables}')
+        return UnwindAvailable(self, ' UNWIND ' + variables)
 
 
 class Where(Query):
     """A class for representing a "WHERE" clause."""
 
+    __slots__ = ()
+
     def where(self, name: str, comparison_operator: str, value: str):
         """Concatenate a WHERE clause to the query, created as {name} {comparison_operator} {value}. E.g. x = 'abc'.
 
@@ -697,12 +777,13 @@ class Where(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: WhereAvailable
         """
-        return self.where_multiple({name: value}, comparison_operator)
+        filt = f'{_WHERE}{name} {comparison_operator} {format_value(value)}'
+        return WhereAvailable(self, filt)
 
     def where_multiple(self, filters: dict, comparison_operator: str = "=", boolean_operator: str = ' AND '):
         """Concatenate a WHERE clause to the query, created from a list of given property filters.
 
-        :param filters: A dict representing the set of properties to be filtered
+        :param filters: A dict representing the set of properties to be filtered (an empty dict adds no WHERE clause)
         :type filters: dict
         :param comparison_operator: A string operator, according to which the comparison between property values is
             done, e.g. for "=", we get: property.name = property.value, defaults to "="
@@ -713,8 +794,11 @@ class Where(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: WhereAvailable
         """
-        filt = ' WHERE ' + Properties(filters).to_str(comparison_operator, boolean_operator)
-        return WhereAvailable(self.query + filt)
+        if not filters:
+            return WhereAvailable(self)
+
+        filt = _WHERE + format_properties(filters, comparison_operator, boolean_operator)
+        return WhereAvailable(self, filt)
 
     def where_literal(self, statement: str):
         """Concatenate a literal WHERE clause to the query.
@@ -725,13 +809,15 @@ class Where(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: WhereAvailable
         """
-        filt = ' WHERE ' + statement
-        return WhereAvailable(self.query + filt)
+        filt = _WHERE + statement
+        return WhereAvailable(self, filt)
 
 
 class With(Query):
     """A class for representing a "WITH" clause."""
 
+    __slots__ = ()
+
     def with_(self, variables: str):
         """Concatenate a WITH clause, keeping one or more variables given in 'variables' arg.
 
@@ -741,12 +827,14 @@ class With(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: WithAvailable
         """
-        return WithAvailable(self.query + f' WITH {variables}')
+        return WithAvailable(self, ' WITH ' + variables)
 
 
 class Yield(Query):
     """A class for representing a "YIELD" clause."""
 
+    __slots__ = ()
+
     def yield_(self, mappings: List[Mapping]):
         """Concatenate a YIELD cluase, to yield a list of Mappings.
 
@@ -756,132 +844,203 @@ class Yield(Query):
         :return: A Query object with a query that contains the new clause.
         :rtype: YieldAvailable
         """
-        if not isinstance(mappings, list):
-            mappings = [mappings]
+        if isinstance(mappings, tuple):
+            return YieldAvailable(self, _yield_one(mappings))
 
-        query = ' YIELD ' + \
-            ', '.join(f'{mapping[0]} as '
-                      f'{mapping[1] if mapping[1] else mapping[0].replace(".", "_")}'
-                      for mapping in mappings)
-        return YieldAvailable(self.query + query)
+        parts = [f'{name}{_AS}{alias if alias else name.replace(".", "_")}' for name, alias in mappings]
+        query = _YIELD + ', '.join(parts)
+        return YieldAvailable(self, query)
 
 
 class QueryStartAvailable(Match, Merge, Call, Create):
     """A class decorator declares a QueryStart is available in the current query."""
 
+    __slots__ = ()
+
+
+class _PostClauseMixin(QueryStartAvailable, With, Unwind, Where, CaseWhen, Return, Set):
+    """A mixin class grouping successors shared by several availability classes."""
+
+    __slots__ = ()
+
 
 class CallAvailable(Node, Return, OperatorStart):
     """A class decorator declares a Call is available in the current query."""
 
+    __slots__ = ()
 
-class CaseWhenAvailable(QueryStartAvailable, With, Unwind, Where, CaseWhen, Return, Set):
+
+class CaseWhenAvailable(_PostClauseMixin):
     """A class decorator declares a CaseWhen is available in the current query."""
 
+    __slots__ = ()
+
 
 class CreateAvailable(Node):
     """A class decorator declares a Create is available in the current query."""
 
+    __slots__ = ()
+
 
 class DeleteAvailable(Return, CaseWhen):
     """A class decorator declares a Delete is available in the current query."""
 
+    __slots__ = ()
+
 
-class LimitAvailable(QueryStartAvailable, With, Unwind, Where, CaseWhen, Return, Set, Skip):
+class LimitAvailable(_PostClauseMixin, Skip):
     """A class decorator declares a Limit is available in the current query."""
 
+    __slots__ = ()
+
 
 class MatchAvailable(Node, Return, OperatorStart):
     """A class decorator declares a Match is available in the current query."""
 
+    __slots__ = ()
+
 
 class MergeAvailable(NodeAfterMerge, Return, OperatorStart):
     """A class decorator declares a Merge is available in the current query."""
 
+    __slots__ = ()
+
 
 class NodeAvailable(Relation, Return, Delete, With, Where, OperatorStart, OperatorEnd, Set, QueryStartAvailable, Merge, Remove):
     """A class decorator declares a Node is available in the current query."""
 
+    __slots__ = ()
+
 
 class NodeAfterMergeAvailable(RelationAfterMerge, Return, Delete, With, OperatorStart, OperatorEnd, SetAfterMerge, OnCreate, OnMatch, QueryStartAvailable):
     """A class decorator declares a NodeAfterMerge is available in the current query."""
 
+    __slots__ = ()
+
 
 class OnCreateAvailable(SetAfterMerge, OperatorStart):
     """A class decorator declares a OnCreate is available in the current query."""
 
+    __slots__ = ()
+
 
 class OnMatchAvailable(SetAfterMerge, OperatorStart):
     """A class decorator declares a OnMatch is available in the current query."""
 
+    __slots__ = ()
+
 
 class OperatorEndAvailable(QueryStartAvailable, Yield, With, Return):
     """A class decorator declares a OperatorEnd is available in the current query."""
 
+    __slots__ = ()
+
 
 class OperatorStartAvailable(QueryStartAvailable, Node, With, OperatorEnd):
     """A class decorator declares a OperatorStart is available in the current query."""
 
+    __slots__ = ()
+
 
 class OrderByAvailable(Limit, Skip):
     """A class decorator declares a OrderBy is available in the current query."""
 
+    __slots__ = ()
+
 
 class RelationAvailable(Node):
     """A class decorator declares a Relation is available in the current query."""
 
+    __slots__ = ()
+
 
 class RelationAfterMergeAvailable(NodeAfterMerge):
     """A class decorator declares a RelationAfterMerge is available in the current query."""
 
+    __slots__ = ()
+
 
 class RemoveAvailable(Set, Return):
     """A class decorator declares a Remove is available in the current query."""
 
+    __slots__ = ()
+
 
 class ReturnAvailable(QueryStartAvailable, With, Unwind, Return, Limit, Skip, OrderBy):
     """A class decorator declares a Return is available in the current query."""
 
+    __slots__ = ()
+
 
 class SetAvailable(QueryStartAvailable, With, Set, Remove, Unwind, Return):
     """A class decorator declares a Set is available in the current query."""
 
+    __slots__ = ()
+
 
 class SetAfterMergeAvailable(QueryStartAvailable, OnCreate, OnMatch, With, SetAfterMerge, Unwind, Return):
     """A class decorator declares a SetAfterMerge is available in the current query."""
 
+    __slots__ = ()
+
 
-class SkipAvailable(QueryStartAvailable, With, Unwind, Where, CaseWhen, Return, Set, Remove, Limit):
+class SkipAvailable(_PostClauseMixin, Remove, Limit):
     """A class decorator declares a Skip is available in the current query."""
 
+    __slots__ = ()
+
 
 class UnwindAvailable(QueryStartAvailable, With, Unwind, Return, Create, Remove):
     """A class decorator declares a Unwind is available in the current query."""
 
+    __slots__ = ()
+
 
 class WhereAvailable(Return, Delete, With, Where, Set, Remove, OperatorStart, QueryStartAvailable):
     """A class decorator declares a Where is available in the current query."""
 
+    __slots__ = ()
+
 
 class WithAvailable(QueryStartAvailable, With, Unwind, Where, Set, Remove, CaseWhen, Return, Limit, Skip, OrderBy):
     """A class decorator declares a With is available in the current query."""
 
+    __slots__ = ()
+
 
 class YieldAvailable(QueryStartAvailable, Node, With):
     """A class decorator declares a Yield is available in the current query."""
 
+    __slots__ = ()
+
+
+if TYPE_CHECKING:
+    class AnyAvailable(Call, CaseWhen, Create, Delete, Limit, Match, Merge, Node, NodeAfterMerge, OnCreate, OnMatch, OperatorEnd, OperatorStart, OrderBy, QueryStart, Relation, RelationAfterMerge, Remove, Return, Set, SetAfterMerge, Skip, Unwind, Where, With, Yield):
+        """A class decorator declares anything is available in the current query."""
 
-class AnyAvailable(Call, CaseWhen, Create, Delete, Limit, Match, Merge, Node, NodeAfterMerge, OnCreate, OnMatch, OperatorEnd, OperatorStart, OrderBy, QueryStart, Relation, RelationAfterMerge, Remove, Return, Set, SetAfterMerge, Skip, Unwind, Where, With, Yield):
-    """A class decorator declares anything is available in the current query."""
+        __slots__ = ()
+else:
+    # Assembled from a merged namespace, so that lookups do not walk a long MRO
+    AnyAvailable = type('AnyAvailable', (Query,), _merged_namespace(Call, CaseWhen, Create, Delete, Limit, Match, Merge, Node, NodeAfterMerge, OnCreate, OnMatch, OperatorEnd, OperatorStart, OrderBy,
+                        QueryStart, Relation, RelationAfterMerge, Remove, Return, Set, SetAfterMerge, Skip, Unwind, Where, With, Yield, __doc__='A class decorator declares anything is available in the current query.'))
 
 
 class QueryBuilder(QueryStartAvailable):
     """The Query Builder's initial interface."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize a query builder."""
-        super().__init__('')
+        super().__init__(None, '')
 
     def reset(self):
-        """Reset the query to an empty string."""
-        self.query = ''
-        return self
+        """Get a new, empty query builder (builders are never modified, so this one is left as it is)."""
+        return QueryBuilder()
+
+
+_SET_AFTER_MERGE_TYPES = _with_subclasses(NodeAfterMergeAvailable, OnCreateAvailable, OnMatchAvailable,
+                                          SetAfterMergeAvailable)
+
+_flatten_methods(_with_subclasses(Query))
+_warm_attribute_cache(_with_subclasses(Query))
@@ -1,11 +1,19 @@
 class QueryBuilder(QueryStartAvailable):
     """The Query Builder's initial interface."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize a query builder."""
-        super().__init__('')
+        super().__init__(None, '')
 
     def reset(self):
-        """Reset the query to an empty string."""
-        self.query = ''
-        return self
+        """Get a new, empty query builder (builders are never modified, so this one is left as it is)."""
+        return QueryBuilder()
+
+
+_SET_AFTER_MERGE_TYPES = _with_subclasses(NodeAfterMergeAvailable, OnCreateAvailable, OnMatchAvailable,
+                                          SetAfterMergeAvailable)
+
+_flatten_methods(_with_subclasses(Query))
+_warm_attribute_cache(_with_subclasses(Query))
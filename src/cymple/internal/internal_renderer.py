@@ -15,6 +15,7 @@ MAX_LINE_LEN = 120
 def _render_clause(declaration: dict):
     main_output = ''
     decorators_output = ''
+    fragments_output = ''
 
     clause_name = declaration['clause_name'].upper()
     clause_name_title = declaration['clause_name'].title().replace(' ', '')
@@ -22,10 +23,12 @@ def _render_clause(declaration: dict):
     successors = declaration['successors']
     avilability_class_str = f'class {clause_name_title}Available({", ".join(successors)}):' + '\n    '
     avilability_class_str += f'"""A class decorator declares a {clause_name_title} is available in the current query."""' + '\n\n'
+    avilability_class_str += '    __slots__ = ()' + '\n\n'
     decorators_output += avilability_class_str
 
     main_output += f'class {clause_name_title}({query_class.__name__}):' + '\n    '
     main_output += f'"""A class for representing a "{clause_name}" clause."""' + '\n\n'
+    main_output += '    __slots__ = ()' + '\n\n'
 
     methods = declaration.get('methods')
 
@@ -98,7 +101,9 @@ def _render_clause(declaration: dict):
         if overload:
             main_output += overload.strip()
         else:
-            main_output += f'return {clause_name_title}Available(self.query + \' {clause_name}\')'
+            fragment_name = '_' + clause_name.replace(' ', '_')
+            fragments_output += f'{fragment_name} = sys.intern(\' {clause_name}\')' + '\n'
+            main_output += f'return {clause_name_title}Available(self, {fragment_name})'
 
         main_output += '\n\n'
 
@@ -129,22 +134,38 @@ def _render_clause(declaration: dict):
 
     main_output = '\n'.join(new_lines)
 
-    return main_output, decorators_output, clause_name_title
+    return main_output, decorators_output, fragments_output, clause_name_title
+
+
+def _render_mixin(mixin_name: str, bases: list):
+    mixin_class_str = f'class {mixin_name}({", ".join(bases)}):' + '\n    '
+    mixin_class_str += '"""A mixin class grouping successors shared by several availability classes."""' + '\n\n'
+    mixin_class_str += '    __slots__ = ()' + '\n\n'
+    return mixin_class_str
 
 
 def render_builder_code():
     """Main function to invoke to render a new builder implementation."""
-    clauses_output = '"""This is the Cymple query builder module."""\n\n'
-    clauses_output += '# pylint: disable=R0901\n'
-    clauses_output += '# pylint: disable=R0903\n'
-    clauses_output += '# pylint: disable=W0102\n'
-    clauses_output += 'from typing import List, Union\n'
-    clauses_output += 'from .typedefs import Mapping, Properties\n\n'
-    clauses_output += inspect.getsource(query_class) + '\n\n'
-
+    preface_lines = inspect.getsource(preface).splitlines()
+    preface_imports = [line for line in preface_lines if line.startswith(('import ', 'from '))]
+    preface_body = '\n'.join(line for line in preface_lines if line not in preface_imports).strip()
+
+    header_output = '"""This is the Cymple query builder module."""\n\n'
+    header_output += '# pylint: disable=R0901\n'
+    header_output += '# pylint: disable=R0903\n'
+    header_output += ''.join(line + '\n' for line in preface_imports)
+    header_output += 'from typing import TYPE_CHECKING, List, Union\n'
+    header_output += 'from .typedefs import Mapping, format_properties, format_properties_inline, format_value\n\n'
+
+    clauses_output = preface_body + '\n\n'
     decorators_output = '\n'
+    fragments_output = ''
 
     all_clauses_titles = set()
+    rendered_availabilities = set()
+
+    with open(os.path.join(os.path.dirname(__file__), 'mixins.json')) as file:
+        pending_mixins = json.load(file)
 
     declarations_fps = os.listdir(os.path.join(os.path.dirname(__file__), 'declarations'))
     declarations_fps.sort()
@@ -155,18 +176,37 @@ def render_builder_code():
 
             with open(path) as file:
                 declaration = json.load(file)
-                add_clause_output, add_decorators_output, clause_name_title = _render_clause(declaration)
+                add_clause_output, add_decorators_output, add_fragments_output, clause_name_title = _render_clause(
+                    declaration)
                 clauses_output += add_clause_output
                 decorators_output += add_decorators_output
+                fragments_output += add_fragments_output
                 all_clauses_titles.add(clause_name_title)
-
-    any_clause_decorator_output = f'class AnyAvailable({", ".join(sorted(all_clauses_titles))}):' + '\n    '
-    any_clause_decorator_output += f'"""A class decorator declares anything is available in the current query."""' + '\n\n'
+                rendered_availabilities.add(f'{clause_name_title}Available')
+
+                # Mixins are rendered as soon as all of the availability classes they derive from are
+                for mixin_name, bases in list(pending_mixins.items()):
+                    if all(base in rendered_availabilities for base in bases if base.endswith('Available')):
+                        decorators_output += _render_mixin(mixin_name, bases)
+                        del pending_mixins[mixin_name]
+
+    any_clause_doc = 'A class decorator declares anything is available in the current query.'
+    any_clause_bases = ", ".join(sorted(all_clauses_titles))
+    any_clause_decorator_output = 'if TYPE_CHECKING:' + '\n    '
+    any_clause_decorator_output += f'class AnyAvailable({any_clause_bases}):' + '\n        '
+    any_clause_decorator_output += f'"""{any_clause_doc}"""' + '\n\n'
+    any_clause_decorator_output += '        __slots__ = ()' + '\n'
+    any_clause_decorator_output += 'else:' + '\n    '
+    any_clause_decorator_output += '# Assembled from a merged namespace, so that lookups do not walk a long MRO' + '\n    '
+    any_clause_decorator_output += f'AnyAvailable = type(\'AnyAvailable\', (Query,), _merged_namespace(' \
+                                   f'{any_clause_bases}, __doc__=\'{any_clause_doc}\'))' + '\n\n\n'
 
     with open(os.path.join(os.path.dirname(__file__), 'finale.py')) as file:
         finale_output = file.read()
 
     with open(os.path.join(os.path.dirname(__file__), '../builder.py'), 'w+') as file:
+        file.write(header_output)
+        file.write(fragments_output)
         file.write(clauses_output)
         file.write(decorators_output)
         file.write(any_clause_decorator_output)
@@ -1,8 +1,8 @@
 def detach_delete(self, ref_name: str):
-    ret = f' DETACH DELETE {ref_name}'
-    return DeleteAvailable(self.query + ret)
+    ret = ' DETACH DELETE ' + ref_name
+    return DeleteAvailable(self, ret)
 
 
 def delete(self, ref_name: str):
-    ret = f' DELETE {ref_name}'
-    return DeleteAvailable(self.query + ret)
+    ret = ' DELETE ' + ref_name
+    return DeleteAvailable(self, ret)
@@ -2,5 +2,5 @@ from typing import Union
 
 
 def limit(self, limitation: Union[int, str]):
-    ret = f" LIMIT {limitation}"
-    return LimitAvailable(self.query + ret)
\ No newline at end of file
+    ret = ' LIMIT ' + str(limitation)
+    return LimitAvailable(self, ret)
\ No newline at end of file
@@ -1,2 +1,2 @@
 def match_optional(self):
-    return MatchAvailable(self.query + ' OPTIONAL MATCH ')
+    return MatchAvailable(self, _MATCH_OPT)
@@ -2,27 +2,12 @@
 
 
 def node(self, labels=None, ref_name: str = None, properties: dict = None):
-    if not labels:
-        labels_string = ''
-    elif isinstance(labels, str):
-        labels_string = f': {labels}'
-    else:
-        labels_string = f': {": ".join(labels).strip()}'
+    node_string = _format_node(labels, ref_name, properties)
 
-    if not properties:
-        property_string = ''
-    else:
-        property_string = f' {{{str(Properties(properties))}}}'
+    if self._fragment[-1:] not in _NODE_NO_SPACE_SUFFIXES:
+        node_string = ' ' + node_string
 
-    ref_name = ref_name or ''
-
-    query = self.query
-    if not (query.endswith('-') or query.endswith('>') or query.endswith('<')):
-        query += ' '
-
-    query += f'({ref_name}{labels_string}{property_string})'
-    
     if isinstance(self, MergeAvailable):
-        return NodeAfterMergeAvailable(query)
+        return NodeAfterMergeAvailable(self, node_string)
 
-    return NodeAvailable(query)
+    return NodeAvailable(self, node_string)
@@ -1,2 +1,2 @@
 def operator_end(self):
-    return OperatorEndAvailable(self.query + ' )')
+    return OperatorEndAvailable(self, _OP_END)
@@ -2,9 +2,8 @@
 
 
 def order_by(sorting_properties, ascending=True):
-    if type(sorting_properties) != list:
-        sorting_properties = [sorting_properties]
+    if isinstance(sorting_properties, list):
+        sorting_properties = ', '.join(sorting_properties)
 
-    ret = f" ORDER BY {', '.join(sorting_properties)}"
-    ret += " ASC" if ascending else " DESC"
-    return OrderByAvailable(self.query + ret)
+    ret = ' ORDER BY ' + sorting_properties + (' ASC' if ascending else ' DESC')
+    return OrderByAvailable(self, ret)
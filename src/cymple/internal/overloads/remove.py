@@ -1,6 +1,6 @@
 
 def remove(properties):
-    if type(properties) != list:
-        properties = [properties]
-    ret = f" REMOVE {', '.join(properties)}"
-    return RemoveAvailable(self.query + ret)
+    if isinstance(properties, list):
+        properties = ', '.join(properties)
+    ret = f" REMOVE {properties}"
+    return RemoveAvailable(self, ret)
@@ -1,8 +1,8 @@
 
 def return_literal(self, literal: str):
-    ret = f' RETURN {literal}'
+    ret = ' RETURN ' + literal
 
-    return ReturnAvailable(self.query + ret)
+    return ReturnAvailable(self, ret)
 
 
 def return_mapping(self, mappings):
@@ -10,8 +10,8 @@ def return_mapping(self, mappings):
         mappings = [mappings]
 
     ret = ' RETURN ' + \
-        ', '.join(
+        ', '.join([
             f'{mapping[0]} as {mapping[1]}' if mapping[1] else mapping[0].replace(".", "_")
-            for mapping in mappings)
+            for mapping in mappings])
 
-    return ReturnAvailable(self.query + ret)
+    return ReturnAvailable(self, ret)
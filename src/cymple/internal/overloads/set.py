@@ -1,9 +1,9 @@
 
 
 def set(self, properties: dict, escape_values: bool = True):
-    query = self.query + ' SET ' + Properties(properties).to_str("=", ", ", escape_values)
+    ret = ' SET ' + format_properties(properties, "=", ", ", escape_values) if properties else ''
     
-    if isinstance(self, NodeAfterMergeAvailable) or isinstance(self, OnCreateAvailable) or isinstance(self, OnMatchAvailable) or isinstance(self, SetAfterMergeAvailable):
-        return SetAfterMergeAvailable(query)
+    if type(self) in _SET_AFTER_MERGE_TYPES:
+        return SetAfterMergeAvailable(self, ret)
 
-    return SetAvailable(query)
+    return SetAvailable(self, ret)
@@ -2,5 +2,5 @@ from typing import Union
 
 
 def skip(self, skip_count: Union[int, str]):
-    ret = f" SKIP {skip_count}"
-    return SkipAvailable(self.query + ret)
+    ret = ' SKIP ' + str(skip_count)
+    return SkipAvailable(self, ret)
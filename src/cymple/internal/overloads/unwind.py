@@ -1,2 +1,2 @@
 def unwind(self, variables: str):
-    return UnwindAvailable(self.query + f' UNWIND {variables}')
+    return UnwindAvailable(self, ' UNWIND ' + variables)
@@ -3,12 +3,16 @@ from typing import Any
 
 
 def where_literal(self, statement: str):
-    filt = ' WHERE ' + statement
-    return WhereAvailable(self.query + filt)
+    filt = _WHERE + statement
+    return WhereAvailable(self, filt)
 
 def where_multiple(self, filters: dict, comparison_operator: str = '=', boolean_operator: str = ' AND '):
-    filt = ' WHERE ' + Properties(filters).to_str(comparison_operator, boolean_operator)
-    return WhereAvailable(self.query + filt)
+    if not filters:
+        return WhereAvailable(self)
+
+    filt = _WHERE + format_properties(filters, comparison_operator, boolean_operator)
+    return WhereAvailable(self, filt)
 
 def where(self, name: str, comparison_operator: str, value: Any):
-    return self.where_multiple({name: value}, comparison_operator)
+    filt = f'{_WHERE}{name} {comparison_operator} {format_value(value)}'
+    return WhereAvailable(self, filt)
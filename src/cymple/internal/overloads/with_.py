@@ -1,2 +1,2 @@
 def with_(self, variables: str):
-    return WithAvailable(self.query + f' WITH {variables}')
+    return WithAvailable(self, ' WITH ' + variables)
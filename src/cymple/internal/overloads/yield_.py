@@ -1,9 +1,7 @@
 def yield_(self, mappings):
-    if not isinstance(mappings, list):
-        mappings = [mappings]
-    
-    query = ' YIELD ' + \
-        ', '.join(f'{mapping[0]} as '
-                  f'{mapping[1] if mapping[1] else mapping[0].replace(".", "_")}'
-                  for mapping in mappings)
-    return YieldAvailable(self.query + query)
+    if isinstance(mappings, tuple):
+        return YieldAvailable(self, _yield_one(mappings))
+
+    parts = [f'{name}{_AS}{alias if alias else name.replace(".", "_")}' for name, alias in mappings]
+    query = _YIELD + ', '.join(parts)
+    return YieldAvailable(self, query)
@@ -1,22 +1,167 @@
+import functools
+import sys
+
+
+_MATCH_OPT = sys.intern(' OPTIONAL MATCH')
+_OP_END = sys.intern(' )')
+_WHERE = sys.intern(' WHERE ')
+_YIELD = sys.intern(' YIELD ')
+_AS = sys.intern(' as ')
+
+_NODE_NO_SPACE_SUFFIXES = frozenset(('-', '>', '<'))
+
+
+def _yield_one(mapping) -> str:
+    """Format a YIELD clause for a single (name, alias) mapping."""
+    name, alias = mapping
+    return f'{_YIELD}{name}{_AS}{alias if alias else name.replace(".", "_")}'
+
+
+def _with_subclasses(*classes: type) -> frozenset:
+    """Get a set of the given classes, along with all of their (transitive) subclasses defined so far."""
+    result = set()
+    pending = list(classes)
+    while pending:
+        cls = pending.pop()
+        if cls not in result:
+            result.add(cls)
+            pending.extend(cls.__subclasses__())
+
+    return frozenset(result)
+
+
+def _merged_namespace(*classes: type, **namespace) -> dict:
+    """Merge the public attributes of the given classes into a single class namespace (earlier classes win)."""
+    merged = {}
+    for cls in classes:
+        for name, attr in vars(cls).items():
+            if not name.startswith('_'):
+                merged.setdefault(name, attr)
+
+    merged.update(namespace, __slots__=())
+    return merged
+
+
+def _flatten_methods(classes) -> None:
+    """Copy the public attributes each class inherits onto the class itself, so lookups do not walk its MRO."""
+    for cls in classes:
+        inherited = {}
+        for base in reversed(cls.__mro__[1:]):
+            inherited.update((name, attr) for name, attr in vars(base).items() if not name.startswith('_'))
+
+        for name, attr in inherited.items():
+            if name not in vars(cls):
+                setattr(cls, name, attr)
+
+
+def _warm_attribute_cache(classes) -> None:
+    """Look up every public attribute of the given classes once, filling the interpreter's type attribute cache."""
+    for cls in classes:
+        for name in dir(cls):
+            if not name.startswith('_'):
+                getattr(cls, name, None)
+
+
+def _format_node(labels=None, ref_name: str = None, properties: dict = None) -> str:
+    """Format a graph node pattern, e.g. (n: Person {name : "Bob"})."""
+    if not labels:
+        labels_string = ''
+    elif isinstance(labels, str):
+        labels_string = f': {labels}'
+    else:
+        labels_string = f': {": ".join(labels).strip()}'
+
+    if not properties:
+        property_string = ''
+    else:
+        property_string = ' ' + format_properties_inline(properties)
+
+    if type(ref_name) is str and len(ref_name) < 64 and ref_name.isidentifier():
+        ref_name = sys.intern(ref_name)
+    elif not ref_name:
+        ref_name = ''
+
+    return f'({ref_name}{labels_string}{property_string})'
+
+
+def _build_relation_body(label: str, ref_name: str, relation_properties: str) -> str:
+    """Format the bracketed part of a relationship pattern, given its already formatted properties string."""
+    relation_type = '' if label is None else f': {label}'
+    relation_ref_name = '' if ref_name is None else f'{ref_name}'
+
+    if relation_ref_name or relation_type:
+        return f'[{relation_ref_name}{relation_type}{relation_properties}]'
+
+    return ''
+
+
+def _format_relation_body(label: str = None, ref_name: str = None, properties: dict = None) -> str:
+    """Format the bracketed part of a relationship pattern, e.g. [r: KNOWS], to be wrapped with its direction."""
+    relation_properties = ' ' + format_properties_inline(properties) if properties else ''
+    return _build_relation_body(label, ref_name, relation_properties)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _format_variable_length_relation(min_hops: int = -1, max_hops: int = -1) -> str:
+    """Format an undirectional variable length relationship pattern, e.g. -[*1..3]- (-1 leaves a boundary open)."""
+    if min_hops == -1:
+        return '-[*]-' if max_hops == -1 else f'-[*..{max_hops}]-'
+    if max_hops == -1:
+        return f'-[*{min_hops}..]-'
+    if min_hops == max_hops:
+        return f'-[*{min_hops}]-'
+
+    return f'-[*{min_hops}..{max_hops}]-'
+
+
 class Query():
     """A general query-descripting class ."""
 
-    def __init__(self, query):
-        """Initialize the query object."""
-        self.query = query
+    __slots__ = ('_parent', '_fragment', '_text')
+
+    def __init__(self, parent, fragment: str = ''):
+        """Initialize the query object, as the given fragment appended to a parent query (None for a new query)."""
+        self._parent = parent
+        self._fragment = fragment
+        self._text = None
+
+    @property
+    def query(self) -> str:
+        """Get the query string built so far (not stripped)."""
+        return self._join()
+
+    def _join(self) -> str:
+        """Join the fragments of this query and all of its parents into a single string (memoized per query)."""
+        text = self._text
+        if text is None:
+            parts = []
+            node = self
+            while node is not None:
+                if node._text is not None:
+                    parts.append(node._text)
+                    break
+
+                parts.append(node._fragment)
+                node = node._parent
+
+            parts.reverse()
+            text = self._text = ''.join(parts)
+
+        return text
 
     def __str__(self) -> str:
         """Implement the str() operator for the query builder."""
-        return self.query.strip()
+        return self._join().strip()
 
     def __add__(self, other):
         """Implement the + operator for the query builder."""
-        return Query(self.query.strip() + ' ' + other.query.strip())
+        return Query(self, other._join())
 
     def __iadd__(self, other):
-        """Implement the += operator for the query builder."""
-        self.query = self.query.strip() + ' ' + other.query.strip()
-        return self
+        """Implement the += operator for the query builder, keeping the type of the current query."""
+        result = type(self).__new__(type(self))
+        Query.__init__(result, self, other._join())
+        return result
 
     def get(self):
         """Get the final query string ."""
@@ -24,4 +169,4 @@ class Query():
 
     def cypher(self, cypher_query_str):
         """Concatenate a cypher query string"""
-        return AnyAvailable(self.query.strip() + ' ' + cypher_query_str.strip())
+        return AnyAvailable(self, ' ' + cypher_query_str.strip())
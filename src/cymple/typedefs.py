@@ -1,36 +1,54 @@
 """Cymple's API type definitions."""
 from collections import namedtuple
+from json.encoder import encode_basestring
 from typing import Any, List
 from dataclasses import dataclass
 
 Mapping = namedtuple('Mapping', ['ref_name', 'returned_name'], defaults=(None, None))
 
+# json's C string encoder: quotes a str, escaping double quotes, backslashes and control characters
+_quote_string = encode_basestring
+
 
 class Properties(dict):
     """A dict class storing a set of properties."""
 
     @staticmethod
     def _escape(string: str) -> str:
-        res = string.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'").replace('\r', '\\r').replace('\n', '\\n')
-        return res
+        return _quote_string(string)[1:-1]
 
     @staticmethod
     def _format_value(value: Any, escape: bool) -> Any:
-        # Assigning a dict to a property is not supported by a neo4j graph
-        # if isinstance(value, dict):
-        #     return str({sub_key: self._format_value(sub_value) for sub_key, sub_value in value.items()})
-        if escape and isinstance(value, str):
-            return f'"{Properties._escape(value)}"'
-        if value is None:
-            return 'null'
-        
-        return value
+        return format_value(value, escape)
 
     def to_str(self, comparison_operator: str = ':', boolean_operator: str = ', ', escape: bool = True) -> str:
         """Convert this Properties dicionarty to a serialied string suitable for a cypher query"""
-        pairs = [f'{key} {comparison_operator} {Properties._format_value(value, escape)}' for key, value in self.items()]
-        res = boolean_operator.join(pairs)
-        return res
+        return format_properties(self, comparison_operator, boolean_operator, escape)
 
     def __str__(self) -> str:
         return self.to_str()
+
+
+def format_value(value: Any, escape: bool = True) -> Any:
+    """Format a single property value for a cypher query, e.g. Bob -> "Bob" and None -> null"""
+    # Assigning a dict to a property is not supported by a neo4j graph
+    # if isinstance(value, dict):
+    #     return str({sub_key: format_value(sub_value) for sub_key, sub_value in value.items()})
+    if escape and isinstance(value, str):
+        return _quote_string(value)
+    if value is None:
+        return 'null'
+
+    return value
+
+
+def format_properties(properties: dict, comparison_operator: str = ':', boolean_operator: str = ', ',
+                      escape: bool = True) -> str:
+    """Serialize a properties dict to a string suitable for a cypher query, without wrapping it in Properties"""
+    pairs = [f'{key} {comparison_operator} {format_value(value, escape)}' for key, value in properties.items()]
+    return boolean_operator.join(pairs)
+
+
+def format_properties_inline(properties: dict) -> str:
+    """Serialize a properties dict to the inline form used in node and relationship patterns, e.g. {name : "Bob"}"""
+    return '{' + format_properties(properties) + '}'
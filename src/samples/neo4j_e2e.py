@@ -25,7 +25,6 @@ def init(neo4j_user, neo4j_password):
 
 def read_movie_node(movie_name: str):
     """Create a query for reading a node labeled 'Movie', with name given in movie_name"""
-    builder.reset()
     query = str(builder
                 .match()
                 .node(labels=label, ref_name=reference, properties={property: movie_name})
@@ -36,7 +35,6 @@ def read_movie_node(movie_name: str):
 
 def write_movie_node(movie_name: str):
     """Create a query for creating a node labeled 'Movie', with name given in movie_name"""
-    builder.reset()
     query = str(builder
                 .merge()
                 .node(labels=label, ref_name=reference, properties={property: movie_name})
@@ -23,3 +23,21 @@ def test_any_available(clause, params):
             func for func in dir(_class[1]) if not func.startswith("__") and func not in callables
         ])
     assert not missing_callables
+
+
+def test_available_methods_are_flattened():
+    available_classes = [_class for _name, _class in inspect.getmembers(
+        builder,
+        lambda member: inspect.isclass(member) and member.__module__ == builder.__name__
+    ) if _name.endswith("Available") or _name == "QueryBuilder"]
+
+    for _class in available_classes:
+        for name in dir(_class):
+            if not name.startswith("_"):
+                assert name in vars(_class), f"{_class.__name__}.{name} is looked up through the MRO"
+
+
+def test_builder_instances_have_no_dict():
+    query = QueryBuilder().match().node(ref_name='n').where('n.name', '=', 'Bob').return_literal('n')
+    for step in (QueryBuilder(), query, query.cypher('LIMIT 1'), query + query):
+        assert not hasattr(step, '__dict__')
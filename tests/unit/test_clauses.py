@@ -1,61 +1,91 @@
+from enum import Enum
+from types import MappingProxyType
+
 import pytest
 from cymple import QueryBuilder
 
-qb = QueryBuilder()
 
-rendered = {
-    '_RESET_': qb.reset(),
-    'CALL': qb.reset().call(),
-    'CASE WHEN': qb.reset().match().node(ref_name='n').with_('n').case_when({'n.name': 'Bob'}, 'true', 'false', 'my_boolean'),
-    'DELETE': qb.reset().match().node(ref_name='n').delete('n'),
-    'DETACH DELETE': qb.reset().match().node(ref_name='n').detach_delete('n'),
-    'WHERE (single)': qb.reset().match().node(ref_name='n').where('n.name', '=', 'value'),
-    'WHERE (multiple)': qb.reset().match().node(ref_name='n').where_multiple({'n.name': 'value', 'n.age': 20}),
-    'WHERE (literal)': qb.reset().match().node(ref_name='n').where_literal('NOT exists(n)'),
-    'MATCH': qb.reset().match(),
-    'MATCH OPTIONAL': qb.reset().match_optional(),
-    'MERGE': qb.reset().merge(),
-    'NODE': qb.reset().match().node(['label1', 'label2'], 'node', {'name': 'Bob'}),
-    'NODE MERGE': qb.reset().merge().node(labels=['label1', 'label2'], ref_name='n', properties={'name': 'Bob'}).related_to().node(ref_name='m'),
-    'OPERATOR': qb.reset().call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end(),
-    'RELATION (forward)': qb.reset().match().node().related_to().node(),
-    'RELATION (backward)': qb.reset().match().node().related_from().node(),
-    'RELATION (unidirectional)': qb.reset().match().node().related().node(),
-    'RELATION (variable length)': qb.reset().match().node().related_variable_len(min_hops=1, max_hops=2).node(),
-    'RELATION (variable length, empty)': qb.reset().match().node().related_variable_len().node(),
-    'RETURN (literal)': qb.reset().match().node(ref_name='n').return_literal('n'),
-    'RETURN (mapping)': qb.reset().match().node(ref_name='n').return_mapping(('n.name', 'name')),
-    'RETURN (mapping, list)': qb.reset().match().node(ref_name='n').return_mapping([('n.name', 'name'), ('n.age', 'age')]),
-    'SET': qb.reset().merge().node(ref_name='n').set({'n.name': 'Alice'}),
-    'SET (not escaping)': qb.reset().merge().node(ref_name='n').set({'n.name': 'n.name + "!"'}, escape_values=False),
-    'ON CREATE': qb.reset().merge().node(ref_name='n').on_create().set({'n.name': 'Bob'}),
-    'ON MATCH': qb.reset().merge().node(ref_name='n').on_match().set({'n.name': 'Bob'}),
-    'ON CREATE ON MATCH': qb.reset().merge().node(ref_name='n').on_create().set({'n.name': 'Bob'}).on_match().set({'n.name': 'Alice'}),
-    'ON MATCH ON CREATE': qb.reset().merge().node(ref_name='n').on_match().set({'n.name': 'Bob'}).on_create().set({'n.name': 'Alice'}),
-    'UNWIND': qb.reset().match().node(ref_name='n').with_('n').unwind('n'),
-    'WITH': qb.reset().match().node(ref_name='a').with_('a,b'),
-    'YIELD': qb.reset().call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end().yield_(('length(p)', 'len')),
-    'YIELD (list)': qb.reset().call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end().yield_([('length(p)', 'len'), ('relationships(p)', 'rels')]),
-    'LIMIT': qb.reset().match().node(ref_name='n').return_literal('n').limit(1),
-    'LIMIT (expression)': qb.reset().match().node(ref_name='n').return_literal('n').limit("1 + toInteger(3 * rand())"),
-    'LIMIT (with)': qb.reset().match().node(ref_name='n').with_('n').limit(1),
-    'LIMIT (with set)': qb.reset().match().node(ref_name='n').with_('n').limit(1).set({'n.name': 'Bob'}),
-    'CYPHER': qb.reset().match().node(ref_name='n').cypher("my cypher").limit(1),
-    'SKIP': qb.reset().match().node(ref_name='n').return_literal('n').skip(1),
-    'SKIP (expression)': qb.reset().match().node(ref_name='n').return_literal('n').skip("1 + toInteger(3 * rand())"),
-    'SKIP (with)': qb.reset().match().node(ref_name='n').with_('n').skip(1),
-    'SKIP (with set)': qb.reset().match().node(ref_name='n').with_('n').skip(1).set({'n.name': 'Bob'}),
-    'ORDER BY': qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by("elementId(n)"),
-    'ORDER BY (List)': qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by(
+@pytest.fixture
+def qb() -> QueryBuilder:
+    return QueryBuilder()
+
+
+class Key(str, Enum):
+    NAME = 'n.name'
+
+
+builders = MappingProxyType({
+    '_RESET_': lambda qb: qb.reset(),
+    'CALL': lambda qb: qb.call(),
+    'CASE WHEN': lambda qb: qb.match().node(ref_name='n').with_('n').case_when({'n.name': 'Bob'}, 'true', 'false', 'my_boolean'),
+    'DELETE': lambda qb: qb.match().node(ref_name='n').delete('n'),
+    'DETACH DELETE': lambda qb: qb.match().node(ref_name='n').detach_delete('n'),
+    'WHERE (single)': lambda qb: qb.match().node(ref_name='n').where('n.name', '=', 'value'),
+    'WHERE (multiple)': lambda qb: qb.match().node(ref_name='n').where_multiple({'n.name': 'value', 'n.age': 20}),
+    'WHERE (multiple, braces)': lambda qb: qb.match().node(ref_name='n').where_multiple({'n.tags': '{a}', 'size(n.{x})': 2}, '<>'),
+    'WHERE (multiple, empty)': lambda qb: qb.match().node(ref_name='n').where_multiple({}).return_literal('n'),
+    'WHERE (multiple, enum key)': lambda qb: qb.match().node(ref_name='n').where_multiple({Key.NAME: 'x'}),
+    'WHERE (single, enum key)': lambda qb: qb.match().node(ref_name='n').where(Key.NAME, '=', 'x'),
+    'WHERE (literal)': lambda qb: qb.match().node(ref_name='n').where_literal('NOT exists(n)'),
+    'WHERE (escaped)': lambda qb: qb.match().node(ref_name='n').where('n.name', '=', 'O\'Hara "Jr"\n\\\t'),
+    'MATCH': lambda qb: qb.match(),
+    'MATCH OPTIONAL': lambda qb: qb.match_optional(),
+    'MATCH OPTIONAL (node)': lambda qb: qb.match_optional().node(ref_name='n'),
+    'MATCH OPTIONAL (cypher)': lambda qb: qb.match_optional().cypher('(n)'),
+    'MATCH OPTIONAL (add)': lambda qb: qb.match_optional() + qb.match().node(ref_name='n'),
+    'MERGE': lambda qb: qb.merge(),
+    'NODE': lambda qb: qb.match().node(['label1', 'label2'], 'node', {'name': 'Bob'}),
+    'NODE (uncached properties)': lambda qb: qb.match().node(ref_name='n', properties={'score': 1.5, 'tags': [1, 2]}),
+    'NODE MERGE': lambda qb: qb.merge().node(labels=['label1', 'label2'], ref_name='n', properties={'name': 'Bob'}).related_to().node(ref_name='m'),
+    'OPERATOR': lambda qb: qb.call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end(),
+    'RELATION (forward)': lambda qb: qb.match().node().related_to().node(),
+    'RELATION (backward)': lambda qb: qb.match().node().related_from().node(),
+    'RELATION (unidirectional)': lambda qb: qb.match().node().related().node(),
+    'RELATION (variable length)': lambda qb: qb.match().node().related_variable_len(min_hops=1, max_hops=2).node(),
+    'RELATION (variable length, min only)': lambda qb: qb.match().node().related_variable_len(min_hops=2).node(),
+    'RELATION (variable length, max only)': lambda qb: qb.match().node().related_variable_len(max_hops=3).node(),
+    'RELATION (variable length, fixed)': lambda qb: qb.match().node().related_variable_len(2, 2).node(),
+    'RELATION (variable length, empty)': lambda qb: qb.match().node().related_variable_len().node(),
+    'RETURN (literal)': lambda qb: qb.match().node(ref_name='n').return_literal('n'),
+    'RETURN (mapping)': lambda qb: qb.match().node(ref_name='n').return_mapping(('n.name', 'name')),
+    'RETURN (mapping, list)': lambda qb: qb.match().node(ref_name='n').return_mapping([('n.name', 'name'), ('n.age', 'age')]),
+    'SET': lambda qb: qb.merge().node(ref_name='n').set({'n.name': 'Alice'}),
+    'SET (integer)': lambda qb: qb.merge().node(ref_name='n').set({'n.flag': 1}),
+    'SET (boolean)': lambda qb: qb.merge().node(ref_name='n').set({'n.flag': True}),
+    'SET (uncached)': lambda qb: qb.merge().node(ref_name='n').set({'n.score': 1.5, 'n.tags': [1, 2]}),
+    'SET (empty)': lambda qb: qb.merge().node(ref_name='n').set({}).on_create().set({'n.name': 'Bob'}),
+    'SET (empty, on create)': lambda qb: qb.merge().node(ref_name='n').on_create().set({}).on_match().set({'n.name': 'Bob'}),
+    'SET (empty, match)': lambda qb: qb.match().node(ref_name='n').set({}).unwind('x'),
+    'SET (not escaping)': lambda qb: qb.merge().node(ref_name='n').set({'n.name': 'n.name + "!"'}, escape_values=False),
+    'ON CREATE': lambda qb: qb.merge().node(ref_name='n').on_create().set({'n.name': 'Bob'}),
+    'ON MATCH': lambda qb: qb.merge().node(ref_name='n').on_match().set({'n.name': 'Bob'}),
+    'ON CREATE ON MATCH': lambda qb: qb.merge().node(ref_name='n').on_create().set({'n.name': 'Bob'}).on_match().set({'n.name': 'Alice'}),
+    'ON MATCH ON CREATE': lambda qb: qb.merge().node(ref_name='n').on_match().set({'n.name': 'Bob'}).on_create().set({'n.name': 'Alice'}),
+    'UNWIND': lambda qb: qb.match().node(ref_name='n').with_('n').unwind('n'),
+    'WITH': lambda qb: qb.match().node(ref_name='a').with_('a,b'),
+    'YIELD': lambda qb: qb.call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end().yield_(('length(p)', 'len')),
+    'YIELD (list)': lambda qb: qb.call().operator_start('SHORTESTPATH', 'p', '(:A)-[*]-(:B)').operator_end().yield_([('length(p)', 'len'), ('relationships(p)', 'rels')]),
+    'YIELD (default alias)': lambda qb: qb.call().operator_start('db.labels').operator_end().yield_(('db.label', None)),
+    'LIMIT': lambda qb: qb.match().node(ref_name='n').return_literal('n').limit(1),
+    'LIMIT (expression)': lambda qb: qb.match().node(ref_name='n').return_literal('n').limit("1 + toInteger(3 * rand())"),
+    'LIMIT (with)': lambda qb: qb.match().node(ref_name='n').with_('n').limit(1),
+    'LIMIT (with set)': lambda qb: qb.match().node(ref_name='n').with_('n').limit(1).set({'n.name': 'Bob'}),
+    'CYPHER': lambda qb: qb.match().node(ref_name='n').cypher("my cypher").limit(1),
+    'SKIP': lambda qb: qb.match().node(ref_name='n').return_literal('n').skip(1),
+    'SKIP (expression)': lambda qb: qb.match().node(ref_name='n').return_literal('n').skip("1 + toInteger(3 * rand())"),
+    'SKIP (with)': lambda qb: qb.match().node(ref_name='n').with_('n').skip(1),
+    'SKIP (with set)': lambda qb: qb.match().node(ref_name='n').with_('n').skip(1).set({'n.name': 'Bob'}),
+    'ORDER BY': lambda qb: qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by("elementId(n)"),
+    'ORDER BY (List)': lambda qb: qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by(
         ["n.name", "keys(n)"]),
-    'ORDER BY (Desc)': qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by("n.name", False),
-    'CREATE': qb.reset().create().node(ref_name='n').return_literal('n'),
-    'REMOVE': qb.reset().match().node(ref_name='n').remove('n.name').return_literal('n.age, n.name'),
-    'REMOVE (list)': qb.reset().match().node(ref_name='n').remove(['n.age', 'n.name']).return_literal('n.age, n.name')
+    'ORDER BY (Desc)': lambda qb: qb.match().node(ref_name='n').return_literal('n.name, n.age').order_by("n.name", False),
+    'CREATE': lambda qb: qb.create().node(ref_name='n').return_literal('n'),
+    'REMOVE': lambda qb: qb.match().node(ref_name='n').remove('n.name').return_literal('n.age, n.name'),
+    'REMOVE (list)': lambda qb: qb.match().node(ref_name='n').remove(['n.age', 'n.name']).return_literal('n.age, n.name')
 
-}
+})
 
-expected = {
+expected = MappingProxyType({
     '_RESET_': '',
     'CALL': 'CALL',
     'CASE WHEN': 'MATCH (n) WITH n CASE WHEN n.name = "Bob" THEN true ELSE false END as my_boolean',
@@ -63,22 +93,40 @@ expected = {
     'DETACH DELETE': 'MATCH (n) DETACH DELETE n',
     'WHERE (single)': 'MATCH (n) WHERE n.name = "value"',
     'WHERE (multiple)': 'MATCH (n) WHERE n.name = "value" AND n.age = 20',
+    'WHERE (multiple, braces)': 'MATCH (n) WHERE n.tags <> "{a}" AND size(n.{x}) <> 2',
+    'WHERE (multiple, enum key)': f'MATCH (n) WHERE {Key.NAME} = "x"',
+    'WHERE (single, enum key)': f'MATCH (n) WHERE {Key.NAME} = "x"',
+    'WHERE (multiple, empty)': 'MATCH (n) RETURN n',
     'WHERE (literal)': 'MATCH (n) WHERE NOT exists(n)',
+    'WHERE (escaped)': 'MATCH (n) WHERE n.name = "O\'Hara \\"Jr\\"\\n\\\\\\t"',
     'MATCH': 'MATCH',
     'MATCH OPTIONAL': 'OPTIONAL MATCH',
+    'MATCH OPTIONAL (node)': 'OPTIONAL MATCH (n)',
+    'MATCH OPTIONAL (cypher)': 'OPTIONAL MATCH (n)',
+    'MATCH OPTIONAL (add)': 'OPTIONAL MATCH MATCH (n)',
     'MERGE': 'MERGE',
     'NODE': 'MATCH (node: label1: label2 {name : "Bob"})',
+    'NODE (uncached properties)': 'MATCH (n {score : 1.5, tags : [1, 2]})',
     'NODE MERGE': 'MERGE (n: label1: label2 {name : "Bob"})-->(m)',
     'OPERATOR': 'CALL p = SHORTESTPATH( (:A)-[*]-(:B) )',
     'RELATION (forward)': 'MATCH ()-->()',
     'RELATION (backward)': 'MATCH ()<--()',
     'RELATION (unidirectional)': 'MATCH ()--()',
     'RELATION (variable length)': 'MATCH ()-[*1..2]-()',
+    'RELATION (variable length, min only)': 'MATCH ()-[*2..]-()',
+    'RELATION (variable length, max only)': 'MATCH ()-[*..3]-()',
+    'RELATION (variable length, fixed)': 'MATCH ()-[*2]-()',
     'RELATION (variable length, empty)': 'MATCH ()-[*]-()',
     'RETURN (literal)': 'MATCH (n) RETURN n',
     'RETURN (mapping)': 'MATCH (n) RETURN n.name as name',
     'RETURN (mapping, list)': 'MATCH (n) RETURN n.name as name, n.age as age',
     'SET': 'MERGE (n) SET n.name = "Alice"',
+    'SET (integer)': 'MERGE (n) SET n.flag = 1',
+    'SET (boolean)': 'MERGE (n) SET n.flag = True',
+    'SET (uncached)': 'MERGE (n) SET n.score = 1.5, n.tags = [1, 2]',
+    'SET (empty)': 'MERGE (n) ON CREATE SET n.name = "Bob"',
+    'SET (empty, on create)': 'MERGE (n) ON CREATE ON MATCH SET n.name = "Bob"',
+    'SET (empty, match)': 'MATCH (n) UNWIND x',
     'SET (not escaping)': 'MERGE (n) SET n.name = n.name + "!"',
     'ON CREATE': 'MERGE (n) ON CREATE SET n.name = "Bob"',
     'ON MATCH': 'MERGE (n) ON MATCH SET n.name = "Bob"',
@@ -88,6 +136,7 @@ expected = {
     'WITH': 'MATCH (a) WITH a,b',
     'YIELD': 'CALL p = SHORTESTPATH( (:A)-[*]-(:B) ) YIELD length(p) as len',
     'YIELD (list)': 'CALL p = SHORTESTPATH( (:A)-[*]-(:B) ) YIELD length(p) as len, relationships(p) as rels',
+    'YIELD (default alias)': 'CALL db.labels( ) YIELD db.label as db_label',
     'LIMIT': 'MATCH (n) RETURN n LIMIT 1',
     'LIMIT (expression)': 'MATCH (n) RETURN n LIMIT 1 + toInteger(3 * rand())',
     'LIMIT (with)': 'MATCH (n) WITH n LIMIT 1',
@@ -103,9 +152,9 @@ expected = {
     'CREATE': 'CREATE (n) RETURN n',
     'REMOVE': 'MATCH (n) REMOVE n.name RETURN n.age, n.name',
     'REMOVE (list)': 'MATCH (n) REMOVE n.age, n.name RETURN n.age, n.name'
-}
+})
 
 
-@pytest.mark.parametrize('clause', expected)
-def test_case(clause: str):
-    assert str(rendered[clause]) == expected[clause]
+@pytest.mark.parametrize('clause', tuple(expected))
+def test_case(qb: QueryBuilder, clause: str):
+    assert str(builders[clause](qb)) == expected[clause]
@@ -1,3 +1,5 @@
+from enum import Enum
+
 from cymple import QueryBuilder
 
 from ..data.onto_types.labels import Labels
@@ -361,6 +363,15 @@ def test_cypher_query_add():
     actual_query = str(actual_query1)
     assert actual_query == expected_query
 
+def test_cypher_query_add_keeps_derived_queries():
+    base_query = QueryBuilder().match().node(ref_name='n')
+    derived_query = base_query.return_literal('n')
+
+    base_query += QueryBuilder().match().node(ref_name='m')
+
+    assert str(base_query) == 'MATCH (n) MATCH (m)'
+    assert str(derived_query) == 'MATCH (n) RETURN n'
+
 def test_cypher_set_unescaped_after_merge():
     node_id = '1'
 
@@ -379,3 +390,47 @@ def test_cypher_set_unescaped_after_merge():
              .get())
 
     assert actual_query == expected_query
+
+def test_cypher_long_where_chain():
+    num_filters = 5000
+    expected_query = 'MATCH (n)' + ''.join(f' WHERE n.id <> {index}' for index in range(num_filters))
+
+    actual_query = QueryBuilder().match().node(ref_name='n')
+    for index in range(num_filters):
+        actual_query = actual_query.where_literal(f'n.id <> {index}')
+
+    assert actual_query.get() == expected_query
+
+def test_cypher_rendered_query_is_memoized():
+    qb = QueryBuilder()
+    base = qb.match().node(ref_name='n')
+    assert base.get() == 'MATCH (n)'
+
+    derived = base.where('n.name', '=', 'Bob')
+    assert derived.get() == base.get() + ' WHERE n.name = "Bob"'
+    assert derived.get() == 'MATCH (n) WHERE n.name = "Bob"'
+
+    assert qb.get() == ''
+    qb += base
+    assert qb.get() == 'MATCH (n)'
+    assert qb.reset().get() == ''
+
+def test_cypher_relation_label_types_are_not_mixed_up():
+    class Relation(str, Enum):
+        KNOWS = 'KNOWS'
+
+    for labels in ((Relation.KNOWS, 'KNOWS'), ('KNOWS', Relation.KNOWS), (1, True), (True, 1)):
+        for label in labels:
+            query = QueryBuilder().match().node().related_to(label).node().get()
+            assert query == f'MATCH ()-[: {label}]->()'
+
+def test_cypher_node_ref_name_types():
+    class RefName(str, Enum):
+        N = 'n'
+
+    class Name(str):
+        pass
+
+    for ref_name in (RefName.N, Name('n'), 1):
+        query = QueryBuilder().match().node(ref_name=ref_name).get()
+        assert query == f'MATCH ({ref_name})'